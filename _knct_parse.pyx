@@ -0,0 +1,56 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+knct.parse_errors 의 Cython 구현
+
+빌드: cythonize -i _knct_parse.pyx
+빌드된 모듈이 없으면 knct 는 순수 파이썬 구현을 사용합니다.
+"""
+
+
+cpdef tuple parse_errors_fast(str sentence, dict error_type):
+    """
+    knct.parse_errors 와 같은 방식으로 <eN>…</eN> 오류 태그를 파싱하여
+    - clean_text: 태그가 제거된 순수 문장
+    - errors: (text, start, end, type) 튜플의 리스트
+    를 반환한다.
+    """
+    cdef list errors = []
+    cdef list clean_parts = []
+    cdef Py_ssize_t last_index = 0
+    cdef Py_ssize_t skipped = 0
+    cdef Py_ssize_t search_index = 0
+    cdef Py_ssize_t open_start, open_end, close_start
+    cdef str tag_name, close_tag, error_text
+
+    while True:
+        open_start = sentence.find('<e', search_index)
+        if open_start < 0:
+            break
+        open_end = sentence.find('>', open_start + 2)
+        if open_end < 0:
+            break
+        tag_name = sentence[open_start + 1:open_end]
+        if not tag_name[1:].isdecimal():
+            search_index = open_start + 1
+            continue
+        close_tag = '</' + tag_name + '>'
+        close_start = sentence.find(close_tag, open_end + 1)
+        if close_start < 0:
+            search_index = open_start + 1
+            continue
+
+        error_text = sentence[open_end + 1:close_start]
+
+        clean_parts.append(sentence[last_index:open_start])
+        clean_parts.append(error_text)
+
+        skipped += open_end + 1 - open_start
+        errors.append((error_text, open_end + 1 - skipped, close_start - skipped,
+                       error_type[tag_name]))
+        skipped += open_end - open_start + 2
+
+        last_index = search_index = close_start + len(close_tag)
+
+    clean_parts.append(sentence[last_index:])
+
+    return ''.join(clean_parts), errors
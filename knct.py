@@ -1,8 +1,31 @@
 import json
+import logging
+import mmap
 import re
-from typing import List, Dict, Any
+import sys
+from typing import List, Dict, Any, Iterator, NamedTuple
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 모듈을 사용
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec 이 없으면 pydantic 으로 검증
+    msgspec = None
+
+try:
+    from _knct_parse import parse_errors_fast
+except ImportError:  # Cython 확장이 빌드되지 않았으면 순수 파이썬 구현을 사용
+    parse_errors_fast = None
+
+logger = logging.getLogger(__name__)
+
+# 오류 태그 전용 정규표현식: <eN>…</eN> (parse_errors 의 탐색과 같은 규칙)
+_TAG_PATTERN = re.compile(r'<(e\d+)>(.*?)</\1>', re.DOTALL)
+
 # Pydantic 모델 정의
 class KNCTEntry(BaseModel):
     """K-NCT 데이터의 개별 항목을 나타내는 모델"""
@@ -30,40 +53,191 @@ class KNCTDataset(BaseModel):
     dataset_schema: KNCTSchema = Field(..., alias="schema")
     data: List[KNCTEntry]
 
-class GrammarError(BaseModel):
-    """문법 오류 정보를 나타내는 모델"""
-    text: str = Field(..., description="오류 텍스트")
-    start: int = Field(..., description="clean_text 상에서의 시작 인덱스")
-    end: int = Field(..., description="clean_text 상에서의 종료 인덱스 (exclusive)")
-    type: str = Field(..., description="오류 타입")
+class GrammarError(NamedTuple):
+    """문법 오류 정보 (parse_errors 에서 대량으로 생성되므로 pydantic 대신 NamedTuple 사용)"""
+    text: str    # 오류 텍스트
+    start: int   # clean_text 상에서의 시작 인덱스
+    end: int     # clean_text 상에서의 종료 인덱스 (exclusive)
+    type: str    # 오류 타입
+
+if msgspec is not None:
+    # JSON 파싱과 스키마 검증을 한 번에 수행하기 위한 msgspec 구조체
+    class _KNCTEntryStruct(msgspec.Struct):
+        index: int
+        error_sentence: str
+        correct_sentence: str
+        domain: str
+        style: str
+        syllable: int
+        phrase: int
+        number_of_error: int = msgspec.field(name="number of error")
+        error_type: Dict[str, str]
+
+    class _KNCTSchemaStruct(msgspec.Struct):
+        fields: List[Dict[str, Any]]
+        primaryKey: List[str]
+        pandas_version: str
+
+    class _KNCTDatasetStruct(msgspec.Struct):
+        dataset_schema: _KNCTSchemaStruct = msgspec.field(name="schema")
+        data: List[_KNCTEntryStruct]
+
+    # 디코더는 스키마를 미리 컴파일하므로 한 번만 만들어 재사용
+    _DATASET_DECODER = msgspec.json.Decoder(_KNCTDatasetStruct)
+    _ENTRY_DECODER = msgspec.json.Decoder(_KNCTEntryStruct)
+
+def _intern_strings(raw_entry: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    항목마다 반복되는 문자열(domain, style, error_type 값)을 sys.intern 으로
+    하나의 객체로 공유하여 메모리 사용량을 줄입니다.
+    """
+    for key in ('domain', 'style'):
+        value = raw_entry.get(key)
+        if type(value) is str:
+            raw_entry[key] = sys.intern(value)
+    error_type = raw_entry.get('error_type')
+    if type(error_type) is dict:
+        for tag_name, value in error_type.items():
+            if type(value) is str:
+                error_type[tag_name] = sys.intern(value)
+    return raw_entry
+
+def _map_file(filepath: str) -> memoryview:
+    """
+    파일을 mmap 으로 열어 복사 없이 파서에 넘길 수 있는 memoryview 를 반환합니다.
+    with 문으로 memoryview 를 해제하면 mmap 도 함께 닫힙니다.
+    빈 파일처럼 mmap 할 수 없는 파일은 그대로 읽어서 반환합니다.
+    """
+    with open(filepath, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return memoryview(f.read())
+    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    return memoryview(mm)
+
+def _loads(buf) -> Any:
+    """orjson 이 있으면 orjson 으로, 없으면 표준 json 모듈로 JSON 을 파싱합니다."""
+    if orjson is not None:
+        try:
+            return orjson.loads(buf)
+        except orjson.JSONDecodeError:
+            # 표준 json 모듈은 허용하지만 orjson 은 거부하는 입력(NaN, Infinity,
+            # 짝이 없는 surrogate 이스케이프 등)은 표준 json 모듈로 다시 파싱
+            pass
+    return json.loads(bytes(buf))
 
 def load_dataset(filepath='K-NCT_v1.5.json') -> List[KNCTEntry]:
     """
     JSON 파일을 로드하고 pydantic을 사용해서 validation을 수행합니다.
+    msgspec 이 설치되어 있으면 파싱과 validation을 msgspec 으로 먼저 시도하고,
+    msgspec 이 거부한 데이터는 pydantic 으로 다시 처리합니다.
     
     Returns:
         List[KNCTEntry]: 검증된 데이터 리스트
     """
+    decoded = None
     try:
-        # JSON 파일 로드
-        with open(filepath, 'r', encoding='utf-8') as f:
-            raw_data = json.load(f)
-    except Exception as e:
-        print(f"Error loading {filepath}: {e}")
+        # JSON 파일 로드 (mmap 으로 복사 없이 파서에 넘기고 UTF-8 디코딩은 파서에 맡김)
+        with _map_file(filepath) as buf:
+            if msgspec is not None:
+                try:
+                    decoded = _DATASET_DECODER.decode(buf)
+                except msgspec.DecodeError:
+                    # pydantic 이 허용하는 값("0" 같은 문자열 숫자, 필드 이름 키 등)이나
+                    # 잘못된 JSON 은 pydantic 경로로 다시 처리하여 결과와 예외를 동일하게 맞춤
+                    decoded = None
+            if decoded is None:
+                raw_data = _loads(buf)
+    except Exception:
+        logger.exception("Error loading %s", filepath)
         raise
 
     try:        
-        # Pydantic 모델로 validation 수행
-        validated_data = KNCTDataset(**raw_data)
+        if decoded is not None:
+            # msgspec 으로 검증된 값으로 모델 생성
+            data = [KNCTEntry.construct(**_intern_strings(msgspec.structs.asdict(e)))
+                    for e in decoded.data]
+        else:
+            # Pydantic 모델로 validation 수행 (검증 전에 반복 문자열을 intern)
+            raw_entries = raw_data.get('data') if isinstance(raw_data, dict) else None
+            if isinstance(raw_entries, list):
+                for raw_entry in raw_entries:
+                    if isinstance(raw_entry, dict):
+                        _intern_strings(raw_entry)
+            data = KNCTDataset(**raw_data).data
         
-        print(f'{len(validated_data.data)} sentences are loaded and validated successfully.')
+        logger.info('%d sentences are loaded and validated successfully.', len(data))
         
-        return validated_data.data
+        return data
         
-    except Exception as e:
-        print(f"Error validating the data: {e}")
+    except Exception:
+        logger.exception("Error validating the data")
         raise
 
+def load_dataset_stream(filepath: str) -> Iterator[KNCTEntry]:
+    """
+    JSON Lines 파일(한 줄에 항목 하나)을 한 줄씩 읽으며 검증된 항목을 차례로 반환합니다.
+    전체 파일을 한 번에 메모리에 올리지 않으므로 큰 데이터셋에 적합합니다.
+    
+    Yields:
+        KNCTEntry: 검증된 데이터 항목
+    """
+    with open(filepath, 'rb') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = None
+                if msgspec is not None:
+                    try:
+                        raw_entry = msgspec.structs.asdict(_ENTRY_DECODER.decode(line))
+                        entry = KNCTEntry.construct(**_intern_strings(raw_entry))
+                    except msgspec.DecodeError:
+                        # load_dataset 과 마찬가지로 msgspec 이 거부한 줄은 pydantic 으로 다시 처리
+                        entry = None
+                if entry is None:
+                    raw_entry = _loads(line)
+                    if isinstance(raw_entry, dict):
+                        _intern_strings(raw_entry)
+                    entry = KNCTEntry(**raw_entry)
+            except Exception:
+                logger.exception("Error validating line %d of %s", line_number, filepath)
+                raise
+            yield entry
+
+def _iter_tags(sentence: str) -> Iterator[tuple[int, int, int, str]]:
+    """
+    정규표현식 대신 str.find 로 <eN> 여는 태그와 짝이 되는 </eN> 닫는 태그를 찾아
+    (open_start, open_end, close_start, tag_name) 을 순서대로 반환한다.
+    - open_start: '<eN>' 의 '<' 위치
+    - open_end: '<eN>' 의 '>' 위치 (오류 텍스트는 open_end + 1 부터)
+    - close_start: '</eN>' 의 '<' 위치 (오류 텍스트의 끝, exclusive)
+    """
+    search_index = 0
+    while True:
+        open_start = sentence.find('<e', search_index)
+        if open_start < 0:
+            return
+        open_end = sentence.find('>', open_start + 2)
+        if open_end < 0:
+            return
+        tag_name = sentence[open_start + 1:open_end]   # e1, e2, ...
+        # eN 형태가 아니거나 닫는 태그가 없으면 다음 위치부터 다시 탐색
+        if not tag_name[1:].isdecimal():
+            search_index = open_start + 1
+            continue
+        close_tag = '</' + tag_name + '>'
+        close_start = sentence.find(close_tag, open_end + 1)
+        if close_start < 0:
+            search_index = open_start + 1
+            continue
+
+        yield open_start, open_end, close_start, tag_name
+
+        search_index = close_start + len(close_tag)
+
 def parse_errors(entry: KNCTEntry) -> tuple[str, List[GrammarError]]:
     """
     <eN>…</eN> 형태의 오류 태그가 포함된 문장을 파싱하여
@@ -73,40 +247,54 @@ def parse_errors(entry: KNCTEntry) -> tuple[str, List[GrammarError]]:
     """
     sentence = entry.error_sentence
     error_type = entry.error_type
-    
-    # 오류 태그 전용 정규표현식: <eN>…</eN>
-    tag_pattern = re.compile(r'<(e\d+)>(.*?)</\1>')
+
+    if parse_errors_fast is not None:
+        clean_text, spans = parse_errors_fast(sentence, error_type)
+        return clean_text, list(map(GrammarError._make, spans))
     
     errors: List[GrammarError] = []
     clean_parts: List[str] = []
     last_index = 0
-    clean_index = 0  # clean_text 상의 누적 길이
+    skipped = 0  # 지금까지 제거된 태그 문자 수 (원문 인덱스 - skipped = clean_text 인덱스)
+    search_index = 0
 
-    # 순회하며 태그와 태그 사이 텍스트 처리
-    for m in tag_pattern.finditer(sentence):
-        tag_name = m.group(1)       # e1, e2, ...
-        error_text = m.group(2)     # 태그 내부의 실제 오류 텍스트
-        span_start, span_end = m.span()
+    # _iter_tags 와 같은 탐색을 기본 경로의 속도를 위해 제너레이터 없이 직접 수행
+    while True:
+        open_start = sentence.find('<e', search_index)
+        if open_start < 0:
+            break
+        open_end = sentence.find('>', open_start + 2)
+        if open_end < 0:
+            break
+        tag_name = sentence[open_start + 1:open_end]   # e1, e2, ...
+        # eN 형태가 아니거나 닫는 태그가 없으면 다음 위치부터 다시 탐색
+        if not tag_name[1:].isdecimal():
+            search_index = open_start + 1
+            continue
+        close_tag = '</' + tag_name + '>'
+        close_start = sentence.find(close_tag, open_end + 1)
+        if close_start < 0:
+            search_index = open_start + 1
+            continue
 
-        # 태그 앞의 순수 텍스트 추가
-        prefix = sentence[last_index:span_start]
-        clean_parts.append(prefix)
-        clean_index += len(prefix)
+        error_text = sentence[open_end + 1:close_start]   # 태그 내부의 실제 오류 텍스트
 
-        # 오류 텍스트만 clean_text 에 추가
+        # 태그 앞의 순수 텍스트와 오류 텍스트만 clean_text 에 추가
+        clean_parts.append(sentence[last_index:open_start])
         clean_parts.append(error_text)
 
         # 오류 정보 기록 (clean_text 상의 인덱스 기준)
+        skipped += open_end + 1 - open_start   # 여는 태그 <eN>
         error_info = GrammarError(
             text=error_text,
-            start=clean_index,
-            end=clean_index + len(error_text),            
+            start=open_end + 1 - skipped,
+            end=close_start - skipped,
             type=error_type[tag_name]
         )
         errors.append(error_info)
-        clean_index += len(error_text)
+        skipped += open_end - open_start + 2   # 닫는 태그 </eN>
 
-        last_index = span_end
+        last_index = search_index = close_start + len(close_tag)
 
     # 마지막 태그 뒤 남은 텍스트 추가
     suffix = sentence[last_index:]
@@ -115,3 +303,35 @@ def parse_errors(entry: KNCTEntry) -> tuple[str, List[GrammarError]]:
     clean_text = ''.join(clean_parts)
 
     return clean_text, errors
+
+def _tag_content(m: re.Match) -> str:
+    return m.group(2)
+
+def clean_only(sentence: str) -> str:
+    """
+    오류 태그만 제거한 순수 문장을 반환한다.
+    오류 위치 정보가 필요 없을 때 parse_errors 보다 빠르다.
+    """
+    # 치환 템플릿(r'\2')보다 함수로 그룹을 반환하는 쪽이 빠름
+    return _TAG_PATTERN.sub(_tag_content, sentence)
+
+def parse_errors_iter(entry: KNCTEntry) -> Iterator[GrammarError]:
+    """
+    parse_errors 와 같은 방식으로 오류 태그를 파싱하되,
+    GrammarError 객체를 리스트로 모으지 않고 찾는 즉시 하나씩 반환한다.
+    일부 오류만 필요한 경우 나머지 문장은 탐색하지 않는다.
+    """
+    sentence = entry.error_sentence
+    error_type = entry.error_type
+
+    skipped = 0  # 지금까지 제거된 태그 문자 수 (원문 인덱스 - skipped = clean_text 인덱스)
+
+    for open_start, open_end, close_start, tag_name in _iter_tags(sentence):
+        skipped += open_end + 1 - open_start   # 여는 태그 <eN>
+        yield GrammarError(
+            text=sentence[open_end + 1:close_start],
+            start=open_end + 1 - skipped,
+            end=close_start - skipped,
+            type=error_type[tag_name]
+        )
+        skipped += open_end - open_start + 2   # 닫는 태그 </eN>
@@ -8,9 +8,13 @@ import unittest
 import tempfile
 import json
 import os
+from unittest import mock
+from pydantic import ValidationError
+import knct
 from knct import (
     KNCTEntry, KNCTSchema, KNCTDataset, GrammarError,
-    load_dataset, parse_errors
+    load_dataset, load_dataset_stream, parse_errors, parse_errors_iter,
+    clean_only
 )
 
 
@@ -185,10 +189,262 @@ class TestLoadKNCTDataset(unittest.TestCase):
         finally:
             os.unlink(temp_file)
     
+    def test_load_same_result_with_and_without_msgspec(self):
+        """msgspec 사용 여부와 관계없이 pydantic 과 같은 결과를 내는지 테스트"""
+        # msgspec 은 거부하지만 pydantic 은 허용하는 값들
+        temp_data = {
+            "schema": {
+                "fields": [{"name": "index", "type": "integer"}],
+                "primaryKey": ["index"],
+                "pandas_version": "0.20.0"
+            },
+            "data": [
+                {
+                    "index": "0",
+                    "error_sentence": "테스트 <e1>문장</e1>",
+                    "correct_sentence": "테스트 문장",
+                    "domain": "test",
+                    "style": "test",
+                    "syllable": 4.0,
+                    "phrase": True,
+                    "number_of_error": 1,
+                    "error_type": {"e1": 1}
+                }
+            ]
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(temp_data, f)
+            temp_file = f.name
+        
+        try:
+            data = load_dataset(temp_file)
+            with mock.patch.object(knct, "msgspec", None):
+                pydantic_data = load_dataset(temp_file)
+            
+            self.assertEqual([e.dict() for e in data], [e.dict() for e in pydantic_data])
+            self.assertEqual(data[0].index, 0)
+            self.assertEqual(data[0].syllable, 4)
+            self.assertEqual(data[0].number_of_error, 1)
+            self.assertEqual(data[0].error_type["e1"], "1")
+        finally:
+            os.unlink(temp_file)
+    
+    def test_load_same_errors_with_and_without_msgspec(self):
+        """msgspec 사용 여부와 관계없이 같은 예외와 로그를 내는지 테스트"""
+        invalid_data = {
+            "schema": {
+                "fields": [{"name": "index", "type": "integer"}],
+                "primaryKey": ["index"],
+                "pandas_version": "0.20.0"
+            },
+            "data": [{"index": 0, "correct_sentence": "테스트 문장"}]
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(invalid_data, f)
+            invalid_file = f.name
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('{"schema": ')
+            malformed_file = f.name
+        
+        try:
+            for patched_msgspec in (knct.msgspec, None):
+                with mock.patch.object(knct, "msgspec", patched_msgspec):
+                    with self.assertLogs('knct', level='ERROR') as logs:
+                        with self.assertRaises(ValidationError):
+                            load_dataset(invalid_file)
+                    self.assertIn("Error validating the data", logs.output[0])
+                    
+                    # 잘못된 JSON 은 로딩 오류로 기록
+                    with self.assertLogs('knct', level='ERROR') as logs:
+                        with self.assertRaises(json.JSONDecodeError):
+                            load_dataset(malformed_file)
+                    self.assertIn("Error loading", logs.output[0])
+        finally:
+            os.unlink(invalid_file)
+            os.unlink(malformed_file)
+    
+    def test_load_interns_repeated_strings(self):
+        """반복되는 문자열이 하나의 객체로 공유되는지 테스트"""
+        temp_data = {
+            "schema": {
+                "fields": [{"name": "index", "type": "integer"}],
+                "primaryKey": ["index"],
+                "pandas_version": "0.20.0"
+            },
+            "data": [
+                {
+                    "index": i,
+                    "error_sentence": "테스트 <e1>문장</e1>",
+                    "correct_sentence": "테스트 문장",
+                    "domain": "daily",
+                    "style": "spoken",
+                    "syllable": 4,
+                    "phrase": 2,
+                    "number of error": 1,
+                    "error_type": {"e1": "punctuation"}
+                }
+                for i in range(2)
+            ]
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(temp_data, f)
+            temp_file = f.name
+        
+        try:
+            for patched_msgspec in (knct.msgspec, None):
+                with mock.patch.object(knct, "msgspec", patched_msgspec):
+                    data = load_dataset(temp_file)
+                self.assertIs(data[0].domain, data[1].domain)
+                self.assertIs(data[0].style, data[1].style)
+                self.assertIs(data[0].error_type["e1"], data[1].error_type["e1"])
+        finally:
+            os.unlink(temp_file)
+    
+    def test_load_empty_file(self):
+        """mmap 할 수 없는 빈 파일은 읽어서 파싱 오류를 내는지 테스트"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_file = f.name
+        
+        try:
+            for patched_msgspec in (knct.msgspec, None):
+                with mock.patch.object(knct, "msgspec", patched_msgspec):
+                    # mmap 의 ValueError("cannot mmap an empty file")가 아닌 JSON 파싱 오류
+                    with self.assertRaises(json.JSONDecodeError):
+                        load_dataset(temp_file)
+        finally:
+            os.unlink(temp_file)
+    
+    def test_load_json_accepted_by_stdlib(self):
+        """표준 json 모듈이 허용하는 NaN 토큰과 짝이 없는 surrogate 이스케이프 로딩 테스트"""
+        entry = {
+            "index": 0,
+            "error_sentence": "테스트 \ud800<e1>문장</e1>",
+            "correct_sentence": "테스트 문장",
+            "domain": "test",
+            "style": "test",
+            "syllable": 4,
+            "phrase": 2,
+            "number of error": 1,
+            "error_type": {"e1": "test"},
+            "score": float("nan")
+        }
+        temp_data = {
+            "schema": {
+                "fields": [{"name": "index", "type": "integer", "default": float("nan")}],
+                "primaryKey": ["index"],
+                "pandas_version": "0.20.0"
+            },
+            "data": [entry]
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(temp_data, f)
+            json_file = f.name
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            f.write(json.dumps(entry) + "\n")
+            jsonl_file = f.name
+        
+        try:
+            for patched_msgspec in (knct.msgspec, None):
+                with mock.patch.object(knct, "msgspec", patched_msgspec):
+                    data = load_dataset(json_file)
+                    stream_data = list(load_dataset_stream(jsonl_file))
+                self.assertEqual(data[0].error_sentence, "테스트 \ud800<e1>문장</e1>")
+                self.assertEqual(stream_data[0].error_sentence, "테스트 \ud800<e1>문장</e1>")
+        finally:
+            os.unlink(json_file)
+            os.unlink(jsonl_file)
+    
     def test_load_nonexistent_file(self):
         """존재하지 않는 파일 로딩 테스트"""
         with self.assertRaises(FileNotFoundError):
             load_dataset("nonexistent_file.json")
+    
+    def test_load_stream_jsonl(self):
+        """JSON Lines 파일 스트리밍 로딩 테스트"""
+        entries = [
+            {
+                "index": i,
+                "error_sentence": "테스트 <e1>문장</e1>",
+                "correct_sentence": "테스트 문장",
+                "domain": "test",
+                "style": "test",
+                "syllable": 4,
+                "phrase": 2,
+                "number of error": 1,
+                "error_type": {"e1": "test"}
+            }
+            for i in range(2)
+        ]
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False,
+                                         encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.write("\n")  # 빈 줄은 무시
+            temp_file = f.name
+        
+        try:
+            data = list(load_dataset_stream(temp_file))
+            self.assertEqual(len(data), 2)
+            self.assertEqual(data[1].index, 1)
+            self.assertEqual(data[0].number_of_error, 1)
+            self.assertEqual(data[0].error_type["e1"], "test")
+        finally:
+            os.unlink(temp_file)
+    
+    def test_load_stream_same_result_with_and_without_msgspec(self):
+        """JSON Lines 로딩도 msgspec 사용 여부와 관계없이 같은 결과를 내는지 테스트"""
+        entry = {
+            "index": "0",
+            "error_sentence": "테스트 <e1>문장</e1>",
+            "correct_sentence": "테스트 문장",
+            "domain": "test",
+            "style": "test",
+            "syllable": 4.0,
+            "phrase": 2,
+            "number_of_error": 1,
+            "error_type": {"e1": "test"}
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False,
+                                         encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            temp_file = f.name
+        
+        try:
+            data = list(load_dataset_stream(temp_file))
+            with mock.patch.object(knct, "msgspec", None):
+                pydantic_data = list(load_dataset_stream(temp_file))
+            
+            self.assertEqual([e.dict() for e in data], [e.dict() for e in pydantic_data])
+            self.assertEqual(data[0].index, 0)
+            self.assertEqual(data[0].number_of_error, 1)
+            
+            # 잘못된 항목은 두 경우 모두 pydantic 예외
+            with open(temp_file, 'w') as f:
+                f.write(json.dumps({"index": 0, "correct_sentence": "테스트 문장"}) + "\n")
+            for patched_msgspec in (knct.msgspec, None):
+                with mock.patch.object(knct, "msgspec", patched_msgspec):
+                    with self.assertRaises(ValidationError):
+                        list(load_dataset_stream(temp_file))
+        finally:
+            os.unlink(temp_file)
+    
+    def test_load_stream_invalid_line(self):
+        """JSON Lines 파일의 잘못된 항목 테스트"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            f.write(json.dumps({"index": 0, "correct_sentence": "테스트 문장"}) + "\n")
+            temp_file = f.name
+        
+        try:
+            with self.assertRaises(Exception):
+                list(load_dataset_stream(temp_file))
+        finally:
+            os.unlink(temp_file)
 
 
 class TestParseErrors(unittest.TestCase):
@@ -290,6 +546,125 @@ class TestParseErrors(unittest.TestCase):
         self.assertEqual(errors[1].text, "문장")
         self.assertEqual(errors[1].type, "error2")
         self.assertEqual(clean_text, "테스트문장입니다.")
+    
+    def test_parse_mismatched_close_tag(self):
+        """닫는 태그가 여는 태그와 다른 경우 - 실제 데이터셋에서 볼 수 있는 케이스"""
+        entry = KNCTEntry(
+            index=0,
+            error_sentence="우정은 <e1>솔선함일라</e2> 말하고 싶습니다.",
+            correct_sentence="우정은 솔선함이라 말하고 싶습니다.",
+            domain="test",
+            style="test",
+            syllable=12,
+            phrase=4,
+            number_of_error=1,
+            error_type={"e1": "suffix,addition"}
+        )
+        
+        clean_text, errors = parse_errors(entry)
+        
+        # 짝이 맞지 않는 태그는 오류로 인식하지 않음
+        self.assertEqual(clean_text, "우정은 <e1>솔선함일라</e2> 말하고 싶습니다.")
+        self.assertEqual(len(errors), 0)
+    
+    def test_parse_newline_inside_tag(self):
+        """태그 내부의 줄바꿈도 일반 문자로 취급하는지 테스트"""
+        entry = KNCTEntry(
+            index=0,
+            error_sentence="테스트 <e1>문\n장</e1>입니다.",
+            correct_sentence="테스트 문장입니다.",
+            domain="test",
+            style="test",
+            syllable=8,
+            phrase=3,
+            number_of_error=1,
+            error_type={"e1": "test_error"}
+        )
+        
+        clean_text, errors = parse_errors(entry)
+        
+        self.assertEqual(clean_text, "테스트 문\n장입니다.")
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0].text, "문\n장")
+        self.assertEqual(errors[0].start, 4)
+        self.assertEqual(errors[0].end, 7)
+        self.assertEqual(list(parse_errors_iter(entry)), errors)
+        self.assertEqual(clean_only(entry.error_sentence), clean_text)
+        
+        # Cython 구현이 없어도 같은 결과
+        with mock.patch.object(knct, "parse_errors_fast", None):
+            self.assertEqual(parse_errors(entry), (clean_text, errors))
+    
+    @unittest.skipIf(knct.parse_errors_fast is None, "Cython 확장이 빌드되지 않음")
+    def test_parse_errors_fast_matches_python(self):
+        """Cython 구현과 순수 파이썬 구현의 결과 비교 테스트"""
+        entry = KNCTEntry(
+            index=0,
+            error_sentence="<e1>저는<</e1> <e2>테스트</e2> </e1>문장<e1> 입니다.",
+            correct_sentence="저는 테스트 문장 입니다.",
+            domain="test",
+            style="test",
+            syllable=9,
+            phrase=4,
+            number_of_error=2,
+            error_type={"e1": "error1", "e2": "error2"}
+        )
+        
+        fast_result = parse_errors(entry)
+        with mock.patch.object(knct, "parse_errors_fast", None):
+            python_result = parse_errors(entry)
+        
+        self.assertEqual(fast_result[0], python_result[0])
+        self.assertEqual(fast_result[1], python_result[1])
+    
+    def test_clean_only(self):
+        """오류 태그만 제거하는 테스트"""
+        sentences = [
+            "<e1>테스트</e1> <e2>문장</e2>입니다.",
+            "그러면 <e1>저는<</e1> 나이가 많이 들어있겠죠.",
+            "우정은 <e1>솔선함일라</e2> 말하고 싶습니다.",
+            "테스트 문장입니다.",
+        ]
+        
+        for sentence in sentences:
+            entry = KNCTEntry(
+                index=0,
+                error_sentence=sentence,
+                correct_sentence="",
+                domain="test",
+                style="test",
+                syllable=0,
+                phrase=0,
+                number_of_error=0,
+                error_type={"e1": "error1", "e2": "error2"}
+            )
+            self.assertEqual(clean_only(sentence), parse_errors(entry)[0])
+        
+        self.assertEqual(clean_only(sentences[0]), "테스트 문장입니다.")
+    
+    def test_parse_errors_iter(self):
+        """오류를 하나씩 반환하는 파싱 테스트"""
+        entry = KNCTEntry(
+            index=0,
+            error_sentence="<e1>테스트</e1> <e2>문장</e2>입니다.",
+            correct_sentence="테스트 문장입니다.",
+            domain="test",
+            style="test",
+            syllable=8,
+            phrase=3,
+            number_of_error=2,
+            error_type={"e1": "error1", "e2": "error2"}
+        )
+        
+        _, errors = parse_errors(entry)
+        iter_errors = list(parse_errors_iter(entry))
+        
+        self.assertEqual(iter_errors, errors)
+        
+        # 첫 번째 오류만 필요한 경우
+        first_error = next(parse_errors_iter(entry))
+        self.assertEqual(first_error.text, "테스트")
+        self.assertEqual(first_error.type, "error1")
 
 
 class TestIntegration(unittest.TestCase):